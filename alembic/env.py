@@ -20,7 +20,9 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-if config.config_file_name is not None:
+# Skipped when a caller runs us in-process with its own connection, so the
+# caller's logging setup is left alone.
+if config.config_file_name is not None and "connection" not in config.attributes:
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
@@ -73,6 +75,18 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # Reuse a connection handed in by an in-process caller
+    # (e.g. setup_postgresql.py) instead of opening a new one
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(
+            connection=connection, target_metadata=target_metadata
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     # Get DATABASE_URL from environment variables
     from app.core.config import settings
     DATABASE_URL = settings.DATABASE_URL
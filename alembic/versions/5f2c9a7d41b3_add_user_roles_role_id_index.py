@@ -0,0 +1,30 @@
+"""add_user_roles_role_id_index
+
+Revision ID: 5f2c9a7d41b3
+Revises: 118966d219d7
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2c9a7d41b3'
+down_revision: Union[str, None] = '118966d219d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The (user_id, role_id) primary key already serves user_id and membership
+    # lookups; index role_id on its own for role -> users lookups
+    op.create_index('ix_user_roles_role_id', 'user_roles', ['role_id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_roles_role_id', table_name='user_roles', if_exists=True)
@@ -36,6 +36,8 @@ class Settings:
     MINIO_SECRET_KEY: Optional[str] = os.getenv("HZ_OBJ_SECRET_KEY")
     MINIO_BUCKET_NAME: str = os.getenv("HZ_OBJ_BUCKET_NAME", "corpus-data")
     MINIO_USE_SSL: bool = os.getenv("HZ_OBJ_USE_SSL", "true").lower() in ("true", "1", "yes")
+    # Bucket region (e.g. "fsn1"); when set, presigning skips the bucket location lookup
+    MINIO_REGION: Optional[str] = os.getenv("HZ_OBJ_REGION")
     
     # JWT settings
     SECRET_KEY: str = os.getenv("APP_SECRET_KEY", "change-in-production")
@@ -7,5 +7,7 @@ from typing import Optional
 class UserRoleLink(SQLModel, table=True):
     __tablename__ = "user_roles"
     
+    # Composite primary key (user_id, role_id) backs per-user and membership lookups;
+    # role_id gets its own index for role -> users lookups
     user_id: Optional[UUID] = Field(default=None, foreign_key="user.id", primary_key=True)
-    role_id: Optional[int] = Field(default=None, foreign_key="role.id", primary_key=True)
+    role_id: Optional[int] = Field(default=None, foreign_key="role.id", primary_key=True, index=True)
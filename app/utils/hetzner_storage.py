@@ -45,7 +45,8 @@ class HetznerStorageClient:
             endpoint,
             access_key=settings.MINIO_ACCESS_KEY,
             secret_key=settings.MINIO_SECRET_KEY,
-            secure=settings.MINIO_USE_SSL
+            secure=settings.MINIO_USE_SSL,
+            region=settings.MINIO_REGION
         )
         
         self.bucket_name = settings.MINIO_BUCKET_NAME
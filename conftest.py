@@ -0,0 +1,111 @@
+"""
+Shared pytest fixtures for the corpus-te test suite.
+"""
+
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+import redis
+
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Shared Redis connection pool so tests reuse connections instead of reconnecting
+REDIS_POOL = redis.ConnectionPool(host='localhost', port=6379, db=0, max_connections=4)
+
+
+# Connect timeout for the service probes; long enough for a local service
+PROBE_TIMEOUT = 0.05
+
+
+def _require_service(name, host, port):
+    """Skip the requesting test unless something is listening on host:port."""
+    try:
+        socket.create_connection((host, port), timeout=PROBE_TIMEOUT).close()
+    except OSError:
+        pytest.skip(f"{name} unavailable at {host}:{port}")
+
+
+@pytest.fixture(scope="session")
+def redis_available():
+    """Probe Redis once per session; dependent tests skip when it is down."""
+    kwargs = REDIS_POOL.connection_kwargs
+    _require_service("redis", kwargs['host'], kwargs['port'])
+
+
+@pytest.fixture(scope="session")
+def postgres_available(engine):
+    """Probe PostgreSQL once per session; dependent tests skip when it is down."""
+    _require_service("postgres", engine.url.host or 'localhost', engine.url.port or 5432)
+
+
+@pytest.fixture(scope="session")
+def redis_client(redis_available):
+    """Redis client backed by the shared connection pool."""
+    return redis.Redis(connection_pool=REDIS_POOL)
+
+
+# Heavy application modules are imported inside session fixtures so that
+# collection stays cheap and each module is initialised once per run.
+
+@pytest.fixture(scope="session")
+def task_module():
+    """The app.tasks package; importing it registers all tasks."""
+    import app.tasks as tasks
+
+    return tasks
+
+
+@pytest.fixture(scope="session")
+def celery_app():
+    """The project's Celery application."""
+    from app.core.celery_app import celery_app
+
+    return celery_app
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """The application's database engine."""
+    from app.db.session import engine
+
+    return engine
+
+
+@pytest.fixture(scope="session")
+def storage_client_class():
+    """The Hetzner storage client class."""
+    from app.utils.hetzner_storage import HetznerStorageClient
+
+    return HetznerStorageClient
+
+
+@pytest.fixture(scope="session")
+def shared_db_session(engine, postgres_available):
+    """One database session (and connection) shared by every test in the run."""
+    from sqlmodel import Session
+
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def db_session(shared_db_session):
+    """The shared database session, rolled back after each test.
+
+    Ending the transaction after every test keeps a failed statement from
+    aborting it for the tests that follow, and keeps the connection from
+    sitting idle in transaction for the rest of the run.
+    """
+    try:
+        yield shared_db_session
+    finally:
+        shared_db_session.rollback()
+
+
+@pytest.fixture(scope="session")
+def registered_custom_tasks(task_module, celery_app):
+    """Names of all registered non-builtin Celery tasks, computed once per session."""
+    return frozenset(name for name in celery_app.tasks if name[:7] != 'celery.')
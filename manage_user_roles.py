@@ -27,20 +27,30 @@ Usage Examples:
 import sys
 import os
 import argparse
-from typing import Optional
+import functools
+from contextlib import contextmanager
+from itertools import groupby
+from typing import List, Optional
 
 # Add the app directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy import case, or_
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlmodel import Session, select
 from app.db.session import engine
 from app.models.user import User
 from app.models.role import Role, RoleEnum
 from app.models.associations import UserRoleLink
 
+# One session per CLI process, shared by every helper a command calls;
+# released by SessionLocal.remove() at the end of run()
+SessionLocal = scoped_session(sessionmaker(bind=engine, class_=Session))
+
+@contextmanager
 def get_database_session():
-    """Get a database session."""
-    return Session(engine)
+    """Get the shared database session for the current command."""
+    yield SessionLocal()
 
 def list_all_users():
     """List all users and their roles."""
@@ -48,23 +58,22 @@ def list_all_users():
     print("=" * 60)
     
     with get_database_session() as session:
-        users = session.exec(select(User)).all()
-        
-        if not users:
-            print("No users found in the database.")
-            return
-        
-        for user in users:
-            # Get user roles
-            role_links = session.exec(
-                select(UserRoleLink).where(UserRoleLink.user_id == user.id)
-            ).all()
-            
-            role_names = []
-            for link in role_links:
-                role = session.exec(select(Role).where(Role.id == link.role_id)).first()
-                if role:
-                    role_names.append(role.name.value)
+        # Stream users joined with their role names in chunks instead of
+        # loading every user up front and querying roles per user
+        statement = (
+            select(User, Role.name)
+            .outerjoin(UserRoleLink, UserRoleLink.user_id == User.id)
+            .outerjoin(Role, Role.id == UserRoleLink.role_id)
+            .order_by(User.id)
+            .execution_options(yield_per=200)
+        )
+        
+        found_users = False
+        for _, rows in groupby(session.exec(statement), key=lambda row: row[0].id):
+            found_users = True
+            rows = list(rows)
+            user = rows[0][0]
+            role_names = [role_name.value for _, role_name in rows if role_name]
             
             roles_str = ", ".join(role_names) if role_names else "No roles assigned"
             
@@ -75,6 +84,9 @@ def list_all_users():
             print(f"   ✅ Active: {user.is_active}")
             print(f"   🆔 ID: {user.id}")
             print("-" * 60)
+        
+        if not found_users:
+            print("No users found in the database.")
 
 def list_all_roles():
     """List all available roles."""
@@ -155,14 +167,13 @@ def find_user_command(phone: Optional[str] = None, email: Optional[str] = None):
 
 def get_user_identifier(identifier: str) -> Optional[User]:
     """Get user by email or phone number."""
-    # Try to find by email first
-    user = find_user_by_email(identifier)
-    if user:
-        return user
-    
-    # Try to find by phone number
-    user = find_user_by_phone(identifier)
-    return user
+    # Match either column in one query, preferring an email match
+    with get_database_session() as session:
+        return session.exec(
+            select(User)
+            .where(or_(User.email == identifier, User.phone == identifier))
+            .order_by(case((User.email == identifier, 0), else_=1))
+        ).first()
 
 def assign_role_to_user(user_identifier: str, role_name: str):
     """Assign a role to a user (replaces existing roles)."""
@@ -176,9 +187,8 @@ def assign_role_to_user(user_identifier: str, role_name: str):
         return
     
     # Validate role
-    try:
-        role_enum = RoleEnum(role_name)
-    except ValueError:
+    role_enum = RoleEnum.__members__.get(role_name)
+    if role_enum is None:
         print(f"❌ Invalid role: {role_name}")
         print(f"   Valid roles: {', '.join([r.value for r in RoleEnum])}")
         return
@@ -223,11 +233,11 @@ def assign_multiple_roles_to_user(user_identifier: str, role_names: list):
     invalid_roles = []
     
     for role_name in role_names:
-        try:
-            role_enum = RoleEnum(role_name)
-            valid_roles.append(role_enum)
-        except ValueError:
+        role_enum = RoleEnum.__members__.get(role_name)
+        if role_enum is None:
             invalid_roles.append(role_name)
+        else:
+            valid_roles.append(role_enum)
     
     if invalid_roles:
         print(f"❌ Invalid roles found: {', '.join(invalid_roles)}")
@@ -283,9 +293,8 @@ def add_role_to_user(user_identifier: str, role_name: str):
         return
     
     # Validate role
-    try:
-        role_enum = RoleEnum(role_name)
-    except ValueError:
+    role_enum = RoleEnum.__members__.get(role_name)
+    if role_enum is None:
         print(f"❌ Invalid role: {role_name}")
         print(f"   Valid roles: {', '.join([r.value for r in RoleEnum])}")
         return
@@ -334,11 +343,11 @@ def add_multiple_roles_to_user(user_identifier: str, role_names: list):
     invalid_roles = []
     
     for role_name in role_names:
-        try:
-            role_enum = RoleEnum(role_name)
-            valid_roles.append(role_enum)
-        except ValueError:
+        role_enum = RoleEnum.__members__.get(role_name)
+        if role_enum is None:
             invalid_roles.append(role_name)
+        else:
+            valid_roles.append(role_enum)
     
     if invalid_roles:
         print(f"❌ Invalid roles found: {', '.join(invalid_roles)}")
@@ -408,9 +417,8 @@ def remove_role_from_user(user_identifier: str, role_name: str):
         return
     
     # Validate role
-    try:
-        role_enum = RoleEnum(role_name)
-    except ValueError:
+    role_enum = RoleEnum.__members__.get(role_name)
+    if role_enum is None:
         print(f"❌ Invalid role: {role_name}")
         print(f"   Valid roles: {', '.join([r.value for r in RoleEnum])}")
         return
@@ -470,8 +478,22 @@ def clear_all_roles_from_user(user_identifier: str):
         print(f"   📧 User: {user.email or user.phone}")
         print(f"   🗑️  Removed {len(existing_links)} role(s)")
 
-def main():
-    """Main function to handle command line arguments."""
+# Command name -> handler taking the parsed arguments
+HANDLERS = {
+    'list-users': lambda args: list_all_users(),
+    'list-roles': lambda args: list_all_roles(),
+    'find-user': lambda args: find_user_command(args.phone, args.email),
+    'assign-role': lambda args: assign_role_to_user(args.user, args.role),
+    'assign-multiple-roles': lambda args: assign_multiple_roles_to_user(args.user, args.roles),
+    'add-role': lambda args: add_role_to_user(args.user, args.role),
+    'add-multiple-roles': lambda args: add_multiple_roles_to_user(args.user, args.roles),
+    'remove-role': lambda args: remove_role_from_user(args.user, args.role),
+    'clear-roles': lambda args: clear_all_roles_from_user(args.user),
+}
+
+@functools.cache
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (built once and reused across calls)."""
     parser = argparse.ArgumentParser(
         description="Telugu Corpus User Role Management",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -534,7 +556,12 @@ Available roles: admin, user, reviewer
     clear_parser = subparsers.add_parser('clear-roles', help='Remove all roles from user')
     clear_parser.add_argument('user', help='User email or phone number')
     
-    args = parser.parse_args()
+    return parser
+
+def run(argv: Optional[List[str]] = None):
+    """Parse the given arguments and run the selected command."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
@@ -544,31 +571,24 @@ Available roles: admin, user, reviewer
     print("=" * 60)
     
     try:
-        if args.command == 'list-users':
-            list_all_users()
-        elif args.command == 'list-roles':
-            list_all_roles()
-        elif args.command == 'find-user':
-            find_user_command(args.phone, args.email)
-        elif args.command == 'assign-role':
-            assign_role_to_user(args.user, args.role)
-        elif args.command == 'assign-multiple-roles':
-            assign_multiple_roles_to_user(args.user, args.roles)
-        elif args.command == 'add-role':
-            add_role_to_user(args.user, args.role)
-        elif args.command == 'add-multiple-roles':
-            add_multiple_roles_to_user(args.user, args.roles)
-        elif args.command == 'remove-role':
-            remove_role_from_user(args.user, args.role)
-        elif args.command == 'clear-roles':
-            clear_all_roles_from_user(args.user)
-        else:
+        handler = HANDLERS.get(args.command)
+        if not handler:
             print(f"❌ Unknown command: {args.command}")
             parser.print_help()
+            return
+        
+        handler(args)
     
     except Exception as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
+    
+    finally:
+        SessionLocal.remove()
+
+def main():
+    """Main function to handle command line arguments."""
+    run(sys.argv[1:])
 
 if __name__ == "__main__":
     main()
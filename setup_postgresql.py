@@ -14,39 +14,91 @@ Usage:
     python setup_postgresql.py [--create-db] [--test-connection] [--enable-postgis] [--migrate] [--seed] [--validate-postgis]
 """
 
+import csv
+import io
 import os
 from dotenv import load_dotenv
 import sys
 import argparse
+import functools
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
 from sqlalchemy import create_engine, text
 import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import execute_values
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
-load_dotenv()
-server_url = os.getenv("DATABASE_URL")
-
 # Add the app directory to the path
 sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), ".")))
 
-from app.core.config import settings
+@functools.lru_cache(maxsize=1)
+def _settings():
+    """Import the app settings on first use rather than at script start-up."""
+    from app.core.config import settings
+    return settings
+
+@contextmanager
+def _raw_conn(dbname: str = "postgres"):
+    """Open a one-shot psycopg2 connection, skipping SQLAlchemy engine setup."""
+    settings = _settings()
+    conn = psycopg2.connect(
+        host=settings.DB_HOST,
+        port=settings.DB_PORT,
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        dbname=dbname
+    )
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+@functools.lru_cache(maxsize=None)
+def _get_db_engine():
+    """Get the shared engine for the target database (created once)."""
+    return create_engine(_settings().DATABASE_URL, pool_pre_ping=True)
+
+def _dispose_engines():
+    """Close pooled connections of the engine created by this script, if any."""
+    if _get_db_engine.cache_info().currsize:
+        _get_db_engine().dispose()
+
+# PostGIS catalog lookups ("postgis_available", "postgis_enabled"), kept for
+# the lifetime of the script and updated when this script changes them
+_catalog_cache: dict[str, bool] = {}
+
+@dataclass(frozen=True)
+class ServerProbe:
+    """Result of the combined PostgreSQL server checks."""
+    version: str
+    database_exists: bool
+    postgis_available: bool
+    postgis_template_exists: bool
+
+_SERVER_PROBE_SQL = """
+    SELECT
+        version(),
+        EXISTS(SELECT 1 FROM pg_database WHERE datname = %(db_name)s),
+        EXISTS(SELECT 1 FROM pg_available_extensions WHERE name = 'postgis'),
+        EXISTS(SELECT 1 FROM pg_database WHERE datname = 'template_postgis')
+"""
+
+@functools.lru_cache(maxsize=1)
+def _server_probe() -> ServerProbe:
+    """Fetch server version, target database existence and PostGIS availability in one round-trip."""
+    with _raw_conn() as conn, conn.cursor() as cursor:
+        cursor.execute(_SERVER_PROBE_SQL, {"db_name": _settings().DB_NAME})
+        return ServerProbe(*cursor.fetchone())
 
 def test_postgres_connection():
     """Test if PostgreSQL server is accessible."""
     try:
-        # Connect to PostgreSQL server (without specifying a database)
-        engine = create_engine(server_url)
-        
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT version()"))
-            version_row = result.fetchone()
-            if version_row and len(version_row) > 0:
-                version = version_row[0]
-                print("✅ PostgreSQL server connection successful!")
-                print(f"   Version: {version}")
-                return True
-            else:
-                print("❌ Could not get PostgreSQL version")
-                return False
+        probe = _server_probe()
+        print("✅ PostgreSQL server connection successful!")
+        print(f"   Version: {probe.version}")
+        return True
     except Exception as e:
         print(f"❌ PostgreSQL server connection failed: {e}")
         print("   Make sure PostgreSQL is running and credentials are correct.")
@@ -55,12 +107,7 @@ def test_postgres_connection():
 def database_exists():
     """Check if the target database exists."""
     try:
-        engine = create_engine(server_url)
-        
-        with engine.connect() as conn:
-            result = conn.execute(text(f"SELECT 1 FROM pg_database WHERE datname='{settings.DB_NAME}'"))
-            exists = result.fetchone() is not None
-            return exists
+        return _server_probe().database_exists
     except Exception as e:
         print(f"❌ Error checking database existence: {e}")
         return False
@@ -68,26 +115,31 @@ def database_exists():
 def create_database():
     """Create the database if it doesn't exist."""
     if database_exists():
-        print(f"✅ Database '{settings.DB_NAME}' already exists.")
+        print(f"✅ Database '{_settings().DB_NAME}' already exists.")
         return True
     
     try:
+        # Clone template_postgis when the server has one, so PostGIS comes
+        # pre-installed instead of being set up by CREATE EXTENSION later
+        create_sql = sql.SQL("CREATE DATABASE {}").format(sql.Identifier(_settings().DB_NAME))
+        from_template = _server_probe().postgis_template_exists
+        if from_template:
+            create_sql += sql.SQL(" TEMPLATE template_postgis")
+        
         # Connect using psycopg2 for database creation
-        conn = psycopg2.connect(
-            host=settings.DB_HOST,
-            port=settings.DB_PORT,
-            user=settings.DB_USER,
-            password=settings.DB_PASSWORD,
-            database="postgres"
-        )
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with _raw_conn() as conn:
+            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(create_sql)
         
-        cursor = conn.cursor()
-        cursor.execute(f'CREATE DATABASE "{settings.DB_NAME}"')
-        cursor.close()
-        conn.close()
+        # The cached server probe still says the database is missing
+        _server_probe.cache_clear()
+        if from_template:
+            _catalog_cache["postgis_enabled"] = True
         
-        print(f"✅ Database '{settings.DB_NAME}' created successfully!")
+        print(f"✅ Database '{_settings().DB_NAME}' created successfully!")
+        if from_template:
+            print("   Cloned from template_postgis (PostGIS pre-installed)")
         return True
     except Exception as e:
         print(f"❌ Failed to create database: {e}")
@@ -96,7 +148,7 @@ def create_database():
 def test_database_connection():
     """Test connection to the target database."""
     try:
-        engine = create_engine(settings.DATABASE_URL)
+        engine = _get_db_engine()
         with engine.connect() as conn:
             result = conn.execute(text("SELECT current_database()"))
             db_row = result.fetchone()
@@ -114,35 +166,68 @@ def test_database_connection():
 def check_postgis_availability():
     """Check if PostGIS extension is available in PostgreSQL."""
     try:
-        engine = create_engine(server_url)
+        if "postgis_available" not in _catalog_cache:
+            _catalog_cache["postgis_available"] = _server_probe().postgis_available
         
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT name FROM pg_available_extensions WHERE name = 'postgis'"))
-            available = result.fetchone() is not None
-            
-            if available:
-                print("✅ PostGIS extension is available in PostgreSQL!")
-                return True
-            else:
-                print("❌ PostGIS extension is not available.")
-                print("   Install PostGIS: sudo apt-get install postgresql-postgis or brew install postgis")
-                return False
+        if _catalog_cache["postgis_available"]:
+            print("✅ PostGIS extension is available in PostgreSQL!")
+            return True
+        else:
+            print("❌ PostGIS extension is not available.")
+            print("   Install PostGIS: sudo apt-get install postgresql-postgis or brew install postgis")
+            return False
     except Exception as e:
         print(f"❌ Error checking PostGIS availability: {e}")
         return False
 
+@dataclass(frozen=True)
+class DatabaseProbe:
+    """Result of the combined target database checks."""
+    postgis_enabled: bool
+    record_table_exists: bool
+    location_udt_name: Optional[str]
+    spatial_index_name: Optional[str]
+
+_DATABASE_PROBE_SQL = text("""
+    SELECT
+        EXISTS(SELECT 1 FROM pg_extension WHERE extname = 'postgis'),
+        EXISTS(
+            SELECT 1 FROM information_schema.tables
+            WHERE table_schema = 'public' AND table_name = 'record'
+        ),
+        (
+            SELECT udt_name FROM information_schema.columns
+            WHERE table_name = 'record' AND column_name = 'location'
+            LIMIT 1
+        ),
+        (
+            SELECT indexname FROM pg_indexes
+            WHERE tablename = 'record' AND indexname LIKE '%location%'
+            LIMIT 1
+        )
+""")
+
+def _database_probe() -> DatabaseProbe:
+    """Fetch PostGIS and Record schema state of the target database in one round-trip."""
+    with _get_db_engine().connect() as conn:
+        row = conn.execute(_DATABASE_PROBE_SQL).one()
+    return DatabaseProbe(*row)
+
 def check_postgis_enabled():
     """Check if PostGIS extension is enabled in the target database."""
+    if "postgis_enabled" in _catalog_cache:
+        return _catalog_cache["postgis_enabled"]
+    
     try:
-        engine = create_engine(settings.DATABASE_URL)
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT extname FROM pg_extension WHERE extname = 'postgis'"))
-            enabled = result.fetchone() is not None
-            return enabled
+        enabled = _database_probe().postgis_enabled
+        _catalog_cache["postgis_enabled"] = enabled
+        return enabled
     except Exception as e:
         print(f"❌ Error checking PostGIS status: {e}")
         return False
 
+_ENABLE_POSTGIS_SCRIPT = "CREATE EXTENSION IF NOT EXISTS postgis; SELECT PostGIS_Version()"
+
 def enable_postgis():
     """Enable PostGIS extension in the target database."""
     if check_postgis_enabled():
@@ -150,17 +235,16 @@ def enable_postgis():
         return True
     
     try:
-        engine = create_engine(settings.DATABASE_URL)
+        engine = _get_db_engine()
         with engine.connect() as conn:
-            # Enable PostGIS extension
-            conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
-            conn.commit()
-            
-            # Verify installation by checking PostGIS version
-            result = conn.execute(text("SELECT PostGIS_Version()"))
+            # Enable PostGIS and verify it by its version in a single round-trip;
+            # the driver returns the result of the last statement in the script
+            result = conn.exec_driver_sql(_ENABLE_POSTGIS_SCRIPT)
             version_row = result.fetchone()
+            conn.commit()
             if version_row and len(version_row) > 0:
                 version = version_row[0]
+                _catalog_cache["postgis_enabled"] = True
                 print("✅ PostGIS extension enabled successfully!")
                 print(f"   PostGIS Version: {version}")
                 return True
@@ -171,64 +255,53 @@ def enable_postgis():
         print(f"❌ Failed to enable PostGIS extension: {e}")
         return False
 
+# The whole validation battery as one SELECT: one round-trip instead of four
+_POSTGIS_VALIDATION_SQL = text("""
+    SELECT
+        PostGIS_Version(),
+        ST_GeomFromText(:point, 4326),
+        ST_X(ST_GeomFromText(:point, 4326)),
+        ST_Y(ST_GeomFromText(:point, 4326)),
+        ST_Distance(ST_GeomFromText(:point, 4326), ST_GeomFromText(:other_point, 4326))
+""")
+
 def validate_postgis_functionality():
     """Validate that PostGIS is working correctly with basic spatial operations."""
     try:
-        engine = create_engine(settings.DATABASE_URL)
-        with engine.connect() as conn:
-            # Test basic PostGIS functions
-            tests = [
-                {
-                    "name": "PostGIS Version",
-                    "query": "SELECT PostGIS_Version()",
-                    "expected": "version string"
-                },
-                {
-                    "name": "Point Creation",
-                    "query": "SELECT ST_GeomFromText('POINT(78.4772 17.4065)', 4326)",
-                    "expected": "geometry object"
-                },
-                {
-                    "name": "Coordinate Extraction",
-                    "query": "SELECT ST_X(ST_GeomFromText('POINT(78.4772 17.4065)', 4326)) as lng, ST_Y(ST_GeomFromText('POINT(78.4772 17.4065)', 4326)) as lat",
-                    "expected": "coordinates"
-                },
-                {
-                    "name": "Distance Calculation",
-                    "query": "SELECT ST_Distance(ST_GeomFromText('POINT(78.4772 17.4065)', 4326), ST_GeomFromText('POINT(77.5946 12.9716)', 4326)) as distance",
-                    "expected": "distance value"
-                }
-            ]
-            
-            print("🧪 Testing PostGIS functionality...")
-            all_passed = True
-            
-            for test in tests:
-                try:
-                    result = conn.execute(text(test["query"]))
-                    row = result.fetchone()
-                    if row:
-                        print(f"  ✅ {test['name']}: PASSED")
-                        if test["name"] == "PostGIS Version":
-                            print(f"     Version: {row[0]}")
-                        elif test["name"] == "Coordinate Extraction":
-                            print(f"     Coordinates: lng={row[0]}, lat={row[1]}")
-                        elif test["name"] == "Distance Calculation":
-                            print(f"     Distance: {row[0]:.2f} degrees")
-                    else:
-                        print(f"  ❌ {test['name']}: FAILED (no result)")
-                        all_passed = False
-                except Exception as e:
-                    print(f"  ❌ {test['name']}: FAILED ({e})")
-                    all_passed = False
-            
-            if all_passed:
-                print("✅ All PostGIS functionality tests passed!")
-                return True
+        print("🧪 Testing PostGIS functionality...")
+        
+        # Test basic PostGIS functions
+        with _get_db_engine().connect() as conn:
+            version, point, lng, lat, distance = conn.execute(
+                _POSTGIS_VALIDATION_SQL,
+                {"point": "POINT(78.4772 17.4065)", "other_point": "POINT(77.5946 12.9716)"}
+            ).one()
+        
+        tests = [
+            ("PostGIS Version", version is not None, f"Version: {version}"),
+            ("Point Creation", point is not None, None),
+            ("Coordinate Extraction", lng is not None and lat is not None, f"Coordinates: lng={lng}, lat={lat}"),
+            ("Distance Calculation", distance is not None,
+             f"Distance: {distance:.2f} degrees" if distance is not None else None),
+        ]
+        
+        all_passed = True
+        for name, passed, detail in tests:
+            if passed:
+                print(f"  ✅ {name}: PASSED")
+                if detail:
+                    print(f"     {detail}")
             else:
-                print("❌ Some PostGIS functionality tests failed.")
-                return False
-                
+                print(f"  ❌ {name}: FAILED (no result)")
+                all_passed = False
+        
+        if all_passed:
+            print("✅ All PostGIS functionality tests passed!")
+            return True
+        else:
+            print("❌ Some PostGIS functionality tests failed.")
+            return False
+            
     except Exception as e:
         print(f"❌ PostGIS validation failed: {e}")
         return False
@@ -236,81 +309,86 @@ def validate_postgis_functionality():
 def validate_record_table_postgis():
     """Validate that the Record table has the correct PostGIS schema."""
     try:
-        engine = create_engine(settings.DATABASE_URL)
-        with engine.connect() as conn:
-            # Check if record table exists
-            result = conn.execute(text("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name = 'record'
-            """))
-            
-            if not result.fetchone():
-                print("ℹ️  Record table not found (migrations may not have been run yet)")
-                return True  # Not an error if migrations haven't been run
-            
-            # Check if location column exists and is geometry type
-            result = conn.execute(text("""
-                SELECT 
-                    column_name,
-                    data_type,
-                    udt_name
-                FROM information_schema.columns 
-                WHERE table_name = 'record' 
-                AND column_name = 'location'
-            """))
-            
-            row = result.fetchone()
-            if row:
-                column_name, data_type, udt_name = row
-                if udt_name == 'geometry':
-                    print("✅ Record table has PostGIS location column (geometry type)")
-                    
-                    # Check for spatial index
-                    result = conn.execute(text("""
-                        SELECT indexname 
-                        FROM pg_indexes 
-                        WHERE tablename = 'record' 
-                        AND indexname LIKE '%location%'
-                    """))
-                    
-                    index_row = result.fetchone()
-                    if index_row:
-                        print(f"✅ Spatial index found: {index_row[0]}")
-                    else:
-                        print("ℹ️  No spatial index found (will be created during migration)")
-                    
-                    return True
-                else:
-                    print(f"❌ Location column exists but wrong type: {udt_name} (expected: geometry)")
-                    return False
-            else:
-                print("ℹ️  Location column not found (old schema or migrations not run)")
-                return True  # Not an error if using old schema
+        probe = _database_probe()
+        
+        if not probe.record_table_exists:
+            print("ℹ️  Record table not found (migrations may not have been run yet)")
+            return True  # Not an error if migrations haven't been run
+        
+        # Check if location column exists and is geometry type
+        if probe.location_udt_name is None:
+            print("ℹ️  Location column not found (old schema or migrations not run)")
+            return True  # Not an error if using old schema
+        
+        if probe.location_udt_name != 'geometry':
+            print(f"❌ Location column exists but wrong type: {probe.location_udt_name} (expected: geometry)")
+            return False
+        
+        print("✅ Record table has PostGIS location column (geometry type)")
+        
+        if probe.spatial_index_name:
+            print(f"✅ Spatial index found: {probe.spatial_index_name}")
+        else:
+            print("ℹ️  No spatial index found (will be created during migration)")
+        
+        return True
                 
     except Exception as e:
         print(f"❌ Record table validation failed: {e}")
         return False
 
 def run_migrations():
-    """Run Alembic migrations."""
+    """Run Alembic migrations in-process on the shared database engine."""
     try:
-        import subprocess
-        result = subprocess.run(["alembic", "upgrade", "head"], 
-                              capture_output=True, text=True, cwd=".")
-        if result.returncode == 0:
-            print("✅ Database migrations completed successfully!")
-            print(result.stdout)
-            return True
-        else:
-            print("❌ Migration failed:")
-            print(result.stderr)
-            return False
+        from alembic import command
+        from alembic.config import Config
+        
+        alembic_cfg = Config(os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini"))
+        with _get_db_engine().begin() as connection:
+            alembic_cfg.attributes["connection"] = connection
+            command.upgrade(alembic_cfg, "head")
+        
+        print("✅ Database migrations completed successfully!")
+        return True
     except Exception as e:
         print(f"❌ Error running migrations: {e}")
         return False
 
+def _bulk_seed(table: str, columns, rows) -> int:
+    """Bulk-load rows into a table over a raw psycopg2 connection.
+    
+    Uses COPY ... FROM STDIN, which is several times faster than multi-row
+    INSERT once seeds grow past ~1k rows, and falls back to execute_values
+    (pages of ~10k rows are the sweet spot) if COPY is not permitted.
+    """
+    if not rows:
+        return 0
+    
+    column_list = sql.SQL(", ").join(map(sql.Identifier, columns))
+    raw_conn = _get_db_engine().raw_connection()
+    try:
+        cursor = raw_conn.cursor()
+        try:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(rows)
+            buffer.seek(0)
+            copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+                sql.Identifier(table), column_list
+            )
+            cursor.copy_expert(copy_sql.as_string(cursor), buffer)
+        except psycopg2.Error:
+            raw_conn.rollback()
+            insert_sql = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+                sql.Identifier(table), column_list
+            )
+            execute_values(cursor, insert_sql.as_string(cursor), rows, page_size=10000)
+        raw_conn.commit()
+        cursor.close()
+    finally:
+        raw_conn.close()
+    
+    return len(rows)
+
 def seed_initial_data():
     """Seed initial roles data."""
     try:
@@ -320,30 +398,48 @@ def seed_initial_data():
         
         with Session(engine) as session:
             # Check if roles already exist
-            from sqlmodel import select
-            existing_roles = len(session.exec(select(Role)).all())
+            from sqlmodel import func, select
+            existing_roles = session.exec(select(func.count()).select_from(Role)).one()
             if existing_roles > 0:
                 print(f"✅ Roles already exist ({existing_roles} roles found).")
                 return True
-            
-            # Create default roles
-            roles = [
-                Role(name=RoleEnum.admin, description="Administrator role"),
-                Role(name=RoleEnum.user, description="Regular user role"),
-                Role(name=RoleEnum.reviewer, description="Content reviewer role")
-            ]
-            
-            for role in roles:
-                session.add(role)
-            
-            session.commit()
-            print("✅ Initial roles seeded successfully!")
-            return True
+        
+        # Create default roles in one bulk load
+        roles = [
+            (RoleEnum.admin.value, "Administrator role"),
+            (RoleEnum.user.value, "Regular user role"),
+            (RoleEnum.reviewer.value, "Content reviewer role")
+        ]
+        
+        _bulk_seed(Role.__tablename__, ("name", "description"), roles)
+        print("✅ Initial roles seeded successfully!")
+        return True
     except Exception as e:
         print(f"❌ Failed to seed initial data: {e}")
         return False
 
+# Setup steps in execution order: (argparse flag, banner, step, hint printed on failure).
+# Every step also runs under --all; the first failing step stops the setup.
+SETUP_STEPS = [
+    ("test_connection", "🔍 Testing PostgreSQL server connection...", test_postgres_connection, None),
+    ("check_postgis", "🗺️  Checking PostGIS availability...", check_postgis_availability,
+     "   Please install PostGIS before continuing."),
+    ("create_db", "🏗️  Creating database...", create_database, None),
+    ("test_connection", "🔍 Testing database connection...", test_database_connection, None),
+    ("enable_postgis", "🗺️  Enabling PostGIS extension...", enable_postgis, None),
+    ("migrate", "🚀 Running database migrations...", run_migrations, None),
+    ("validate_postgis", "🧪 Validating PostGIS functionality...", validate_postgis_functionality, None),
+    ("validate_schema", "🔍 Validating Record table PostGIS schema...", validate_record_table_postgis, None),
+    ("seed", "🌱 Seeding initial data...", seed_initial_data, None),
+]
+
 def main():
+    try:
+        run_setup()
+    finally:
+        _dispose_engines()
+
+def run_setup():
     parser = argparse.ArgumentParser(description="PostgreSQL Database Setup with PostGIS Support")
     parser.add_argument("--create-db", action="store_true", help="Create database if it doesn't exist")
     parser.add_argument("--test-connection", action="store_true", help="Test database connection")
@@ -357,10 +453,12 @@ def main():
     
     args = parser.parse_args()
     
+    # Load .env only once we know there is work to do (--help exits above)
+    load_dotenv()
+    
     # If no specific flags, show current configuration
-    if not any([args.create_db, args.test_connection, args.check_postgis, 
-                args.enable_postgis, args.migrate, args.seed, args.validate_postgis, 
-                args.validate_schema, args.all]):
+    if not args.all and not any(getattr(args, flag) for flag, *_ in SETUP_STEPS):
+        settings = _settings()
         print("🔧 Current PostgreSQL Configuration:")
         print(f"   Host: {settings.DB_HOST}")
         print(f"   Port: {settings.DB_PORT}")
@@ -373,71 +471,21 @@ def main():
         print("\nUse --help to see available options, or --all to run full setup.")
         return
     
-    success = True
-    
-    if args.all or args.test_connection:
-        print("🔍 Testing PostgreSQL server connection...")
-        if not test_postgres_connection():
-            success = False
-            return
-    
-    if args.all or args.check_postgis:
-        print("🗺️  Checking PostGIS availability...")
-        if not check_postgis_availability():
-            print("   Please install PostGIS before continuing.")
-            success = False
-            return
-    
-    if args.all or args.create_db:
-        print("🏗️  Creating database...")
-        if not create_database():
-            success = False
-            return
-    
-    if args.all or args.test_connection:
-        print("🔍 Testing database connection...")
-        if not test_database_connection():
-            success = False
-            return
-    
-    if args.all or args.enable_postgis:
-        print("🗺️  Enabling PostGIS extension...")
-        if not enable_postgis():
-            success = False
-            return
-    
-    if args.all or args.migrate:
-        print("🚀 Running database migrations...")
-        if not run_migrations():
-            success = False
-            return
-    
-    if args.all or args.validate_postgis:
-        print("🧪 Validating PostGIS functionality...")
-        if not validate_postgis_functionality():
-            success = False
-            return
-    
-    if args.all or args.validate_schema:
-        print("🔍 Validating Record table PostGIS schema...")
-        if not validate_record_table_postgis():
-            success = False
-            return
-    
-    if args.all or args.seed:
-        print("🌱 Seeding initial data...")
-        if not seed_initial_data():
-            success = False
+    for flag, banner, step, failure_hint in SETUP_STEPS:
+        if not (args.all or getattr(args, flag)):
+            continue
+        
+        print(banner)
+        if not step():
+            if failure_hint:
+                print(failure_hint)
             return
     
-    if success:
-        print("\n🎉 Database setup completed successfully!")
-        print("   ✅ PostgreSQL database is ready")
-        print("   ✅ PostGIS extension is enabled and functional")
-        print("   ✅ Spatial data support is available for Record locations")
-        print("\nYou can now start the FastAPI application with geographic features.")
-    else:
-        print("\n❌ Database setup failed. Please check the errors above.")
+    print("\n🎉 Database setup completed successfully!")
+    print("   ✅ PostgreSQL database is ready")
+    print("   ✅ PostGIS extension is enabled and functional")
+    print("   ✅ Spatial data support is available for Record locations")
+    print("\nYou can now start the FastAPI application with geographic features.")
 
 if __name__ == "__main__":
     main()
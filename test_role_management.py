@@ -3,8 +3,10 @@
 Quick test of user role management functionality
 """
 
+import io
 import sys
 import os
+from itertools import groupby
 
 # Add the app directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -17,39 +19,49 @@ from app.models.associations import UserRoleLink
 
 def test_role_management():
     """Test basic role management functionality."""
-    print("🧪 Testing User Role Management")
-    print("=" * 50)
+    # Collect the report in memory and write it out in one go
+    buf = io.StringIO()
+    
+    print("🧪 Testing User Role Management", file=buf)
+    print("=" * 50, file=buf)
     
     with Session(engine) as session:
         # List roles
-        print("\n🔑 Available Roles:")
+        print("\n🔑 Available Roles:", file=buf)
         roles = session.exec(select(Role)).all()
         for role in roles:
-            print(f"  - {role.name.value}: {role.description}")
+            print(f"  - {role.name.value}: {role.description}", file=buf)
         
-        # List users
-        print("\n👥 All Users:")
-        users = session.exec(select(User)).all()
-        for user in users:
-            print(f"  - {user.name} ({user.email or user.phone})")
-            
-            # Get user roles
-            role_links = session.exec(
-                select(UserRoleLink).where(UserRoleLink.user_id == user.id)
-            ).all()
-            
-            user_roles = []
-            for link in role_links:
-                role = session.exec(select(Role).where(Role.id == link.role_id)).first()
-                if role:
-                    user_roles.append(role.name.value)
+        # List users with their role names in one joined query instead of
+        # querying links and roles per user
+        print("\n👥 All Users:", file=buf)
+        statement = (
+            select(User, Role.name)
+            .outerjoin(UserRoleLink, UserRoleLink.user_id == User.id)
+            .outerjoin(Role, Role.id == UserRoleLink.role_id)
+            .order_by(User.id)
+        )
+        
+        user_count = 0
+        assignment_count = 0
+        for _, rows in groupby(session.exec(statement), key=lambda row: row[0].id):
+            rows = list(rows)
+            user = rows[0][0]
+            user_roles = [role_name.value for _, role_name in rows if role_name]
+            user_count += 1
+            assignment_count += len(user_roles)
             
-            print(f"    Roles: {', '.join(user_roles) if user_roles else 'None'}")
+            print(f"  - {user.name} ({user.email or user.phone})", file=buf)
+            print(f"    Roles: {', '.join(user_roles) if user_roles else 'None'}", file=buf)
         
-        print(f"\n📊 Summary:")
-        print(f"  - Total roles: {len(roles)}")
-        print(f"  - Total users: {len(users)}")
-        print(f"  - Total role assignments: {len(session.exec(select(UserRoleLink)).all())}")
+        print(f"\n📊 Summary:", file=buf)
+        print(f"  - Total roles: {len(roles)}", file=buf)
+        print(f"  - Total users: {user_count}", file=buf)
+        print(f"  - Total role assignments: {assignment_count}", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
 
 if __name__ == "__main__":
     test_role_management()
@@ -3,15 +3,20 @@
 Simple task execution test - focusing on working tasks only.
 """
 
-import time
 import sys
 from pathlib import Path
 
 # Add the app directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from celery import group
+from celery.exceptions import TimeoutError
+
 from app.core.celery_app import celery_app
 
+# Evaluate the task registry once, up front
+celery_app.finalize()
+
 
 def test_simple_tasks():
     """Test simple working tasks."""
@@ -32,35 +37,37 @@ def test_simple_tasks():
         },
     ]
     
-    for test_case in test_tasks:
+    try:
+        # Publish all tasks in one batch over a single producer connection
+        group_result = group(
+            celery_app.signature(test_case['task'], args=test_case['args'])
+            for test_case in test_tasks
+        ).apply_async()
+    except Exception as e:
+        print(f"\n❌ Failed to send tasks: {e}")
+        return
+    
+    for test_case, result in zip(test_tasks, group_result.results):
         print(f"\n🔄 Testing: {test_case['name']}")
         print(f"   Task: {test_case['task']}")
         
         try:
-            # Send task
-            result = celery_app.send_task(
-                test_case['task'], 
-                args=test_case['args']
-            )
-            
             print(f"   Task ID: {result.task_id}")
             
-            # Wait for completion 
-            for i in range(15):  # Wait up to 15 seconds
-                status = result.status
-                if status == 'SUCCESS':
-                    task_result = result.get()
-                    print(f"   ✅ Success: {task_result}")
-                    break
-                elif status == 'FAILURE':
-                    print(f"   ❌ Failed: {result.traceback}")
-                    break
-                elif i == 14:
-                    print(f"   ⏱️  Timeout: Status {status}")
-                    break
-                else:
-                    print(f"   Status: {status}", end='\r')
-                    time.sleep(1)
+            # Wait up to 15 seconds; the Redis result backend wakes us through
+            # pub/sub as soon as the worker stores the result
+            try:
+                result.get(timeout=15, propagate=False)
+            except TimeoutError:
+                pass
+            
+            status = result.status
+            if status == 'SUCCESS':
+                print(f"   ✅ Success: {result.result}")
+            elif status == 'FAILURE':
+                print(f"   ❌ Failed: {result.traceback}")
+            else:
+                print(f"   ⏱️  Timeout: Status {status}")
                     
         except Exception as e:
             print(f"   ❌ Exception: {e}")
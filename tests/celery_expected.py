@@ -0,0 +1,32 @@
+"""
+Expected Celery task registry and database probe shared by the Celery tests.
+"""
+
+# Custom Celery tasks that must be registered by app.tasks
+EXPECTED_TASKS = frozenset({
+    'app.tasks.file_processing.process_audio_file',
+    'app.tasks.file_processing.upload_to_storage',
+    'app.tasks.file_processing.batch_process_files',
+    'app.tasks.notifications.send_email',
+    'app.tasks.notifications.send_processing_complete_notification',
+    'app.tasks.notifications.send_bulk_notification',
+    'app.tasks.notifications.send_system_alert',
+    'app.tasks.data_analysis.analyze_audio_content',
+    'app.tasks.data_analysis.generate_corpus_statistics',
+    'app.tasks.data_analysis.batch_language_detection',
+    'app.tasks.maintenance.cleanup_old_files',
+    'app.tasks.maintenance.optimize_database',
+    'app.tasks.maintenance.health_check',
+    'app.tasks.maintenance.backup_database',
+    'app.tasks.reports.generate_daily_report',
+    'app.tasks.reports.generate_user_report',
+    'app.tasks.reports.generate_system_health_report',
+    'app.tasks.reports.export_user_data',
+})
+
+# Planner row estimates for the user and record tables, read from the catalog
+# instead of scanning either table; one row comes back per table that exists
+DATABASE_PROBE_SQL = (
+    "SELECT relname, reltuples::bigint FROM pg_class "
+    "WHERE relname IN ('user', 'record') AND relnamespace = 'public'::regnamespace"
+)
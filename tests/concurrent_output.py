@@ -0,0 +1,69 @@
+"""
+Run independent test-script checks concurrently while keeping their output
+readable: each check's prints are captured per thread and replayed in the
+original order once all of them have finished.
+"""
+
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ThreadLocalStdout(io.TextIOBase):
+    """Stdout proxy that sends writes to a per-thread buffer while one is set."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer):
+        self._local.buffer = buffer
+
+    def release(self):
+        self._local.buffer = None
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def run_captured(test, stdout, report_failures=False):
+    """Run one check with its output captured, returning (result, output).
+
+    A check that raises is reported as crashed and gives None; with
+    report_failures, a falsy result is also reported as failed.
+    """
+    buffer = io.StringIO()
+    stdout.capture(buffer)
+    try:
+        result = test()
+        if report_failures and not result:
+            print(f"❌ Test {test.__name__} failed")
+    except Exception as e:
+        print(f"❌ Test {test.__name__} crashed: {e}")
+        result = None
+    finally:
+        stdout.release()
+    return result, buffer.getvalue()
+
+
+def run_concurrently(tests, report_failures=False):
+    """Run the checks on a thread pool, replay their output in order and return their results."""
+    stdout = ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            outcomes = list(executor.map(
+                lambda test: run_captured(test, stdout, report_failures), tests
+            ))
+    finally:
+        sys.stdout = stdout.stream
+
+    for _, output in outcomes:
+        sys.stdout.write(output)
+
+    return [result for result, _ in outcomes]
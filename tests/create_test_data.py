@@ -3,14 +3,21 @@
 Create test data: 3 users (admin, reviewer, user roles), 2 categories, and 4 records
 """
 
+import functools
+import hashlib
+import inspect
+import json
 import sys
 import os
 from datetime import datetime, date, timezone
+from pathlib import Path
+from uuid import UUID
 
 # Add the app directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from sqlmodel import Session, select
+from sqlalchemy import Float, bindparam, delete, insert
+from sqlmodel import Session, func, select
 from app.db.session import engine
 from app.models.user import User
 from app.models.role import Role, RoleEnum
@@ -19,6 +26,80 @@ from app.models.record import Record, MediaType
 from app.models.associations import UserRoleLink
 from app.core.auth import get_password_hash
 
+# Manifest of the last successful seeding run
+SEED_CACHE = Path(__file__).with_name(".seed_cache.json")
+
+# Bulk inserts send up to this many rows per multi-row INSERT statement
+BULK_INSERT_OPTIONS = {"insertmanyvalues_page_size": 1000}
+
+
+@functools.lru_cache(maxsize=None)
+def _password_hash(password):
+    """Hash a test password once per process."""
+    return get_password_hash(password)
+
+
+def _seed_version():
+    """Hash of the seeding code, so any change to the test data invalidates the cache."""
+    return hashlib.sha1(inspect.getsource(create_test_data).encode()).hexdigest()
+
+
+def _seed_cache_is_current():
+    """Whether the cached manifest matches this seed version and its rows still exist."""
+    try:
+        manifest = json.loads(SEED_CACHE.read_text())
+    except (OSError, ValueError):
+        return False
+    if manifest.get("version") != _seed_version():
+        return False
+    
+    # Verify with a single query that the seeded rows, and the users' role
+    # links, were not removed since
+    with Session(engine) as session:
+        users, users_with_roles, categories, records = session.exec(
+            select(
+                select(func.count()).select_from(User)
+                .where(User.phone.in_(list(manifest["user_ids"]))).scalar_subquery(),
+                select(func.count(func.distinct(UserRoleLink.user_id)))
+                .where(UserRoleLink.user_id.in_([UUID(user_id) for user_id in manifest["user_ids"].values()]))
+                .scalar_subquery(),
+                select(func.count()).select_from(Category)
+                .where(Category.name.in_(list(manifest["category_ids"]))).scalar_subquery(),
+                select(func.count()).select_from(Record)
+                .where(Record.title.in_(manifest["record_titles"])).scalar_subquery()
+            )
+        ).one()
+    return (users, users_with_roles, categories, records) == (
+        len(manifest["user_ids"]), len(manifest["user_ids"]),
+        len(manifest["category_ids"]), len(manifest["record_titles"])
+    )
+
+
+def _print_summary(session):
+    """Print the table totals and the test login credentials."""
+    print("\n" + "=" * 50)
+    print("📊 Test Data Creation Summary")
+    print("=" * 50)
+    
+    # Count existing data server-side, all five counts in one round-trip
+    total_users, total_roles, total_categories, total_records, total_role_assignments = session.exec(
+        select(*(
+            select(func.count()).select_from(model).scalar_subquery()
+            for model in (User, Role, Category, Record, UserRoleLink)
+        ))
+    ).one()
+    
+    print(f"👥 Total Users: {total_users}")
+    print(f"🔑 Total Roles: {total_roles}")
+    print(f"📂 Total Categories: {total_categories}")
+    print(f"📝 Total Records: {total_records}")
+    print(f"🔗 Total Role Assignments: {total_role_assignments}")
+    
+    print("\n🔐 Test Login Credentials:")
+    print("   Admin:    phone=1111111111, password=admin123")
+    print("   Reviewer: phone=2222222222, password=reviewer123")
+    print("   User:     phone=3333333333, password=user123")
+
 
 def create_test_data():
     """Create comprehensive test data for the application"""
@@ -26,10 +107,58 @@ def create_test_data():
     print("🚀 Creating Test Data")
     print("=" * 50)
     
+    if _seed_cache_is_current():
+        print(f"✅ Test data already seeded (cached in {SEED_CACHE.name}), skipping writes")
+        with Session(engine) as session:
+            _print_summary(session)
+        return
+    
+    # The 3 test users; bcrypt is slow, so hash their passwords up front
+    # rather than while the seeding transaction is open
+    users_data = [
+        {
+            "phone": "1111111111",
+            "name": "Admin User",
+            "email": "admin@example.com",
+            "gender": "other",
+            "date_of_birth": date(1990, 1, 15),
+            "place": "Hyderabad, Telangana",
+            "password": "admin123",
+            "role": RoleEnum.admin
+        },
+        {
+            "phone": "2222222222", 
+            "name": "Reviewer User",
+            "email": "reviewer@example.com",
+            "gender": "female",
+            "date_of_birth": date(1985, 6, 20),
+            "place": "Bangalore, Karnataka",
+            "password": "reviewer123",
+            "role": RoleEnum.reviewer
+        },
+        {
+            "phone": "3333333333",
+            "name": "Regular User",
+            "email": "user@example.com", 
+            "gender": "male",
+            "date_of_birth": date(1995, 12, 10),
+            "place": "Chennai, Tamil Nadu",
+            "password": "user123",
+            "role": RoleEnum.user
+        }
+    ]
+    password_hashes = {
+        user_data["phone"]: _password_hash(user_data["password"]) for user_data in users_data
+    }
+    
+    # Everything below runs in one transaction and is committed once, so a
+    # failure never leaves half-created test data behind
     with Session(engine) as session:
         
         # 1. Ensure roles exist (should already exist from migration)
         print("\n1. 🔑 Checking/Creating Roles...")
+        # Collect the per-row lines and write the section out in one go
+        log_lines = []
         
         roles_data = [
             {"name": RoleEnum.admin, "description": "Administrator with full access"},
@@ -37,99 +166,82 @@ def create_test_data():
             {"name": RoleEnum.user, "description": "Regular user with limited access"}
         ]
         
-        role_objects = {}
+        # One IN query finds the roles that already exist
+        role_objects = {
+            role.name: role for role in session.exec(
+                select(Role).where(Role.name.in_([d["name"] for d in roles_data]))
+            ).all()
+        }
+        
         for role_data in roles_data:
-            existing_role = session.exec(
-                select(Role).where(Role.name == role_data["name"])
-            ).first()
-            
-            if not existing_role:
+            if role_data["name"] in role_objects:
+                log_lines.append(f"   ℹ️ Role already exists: {role_data['name']}")
+            else:
                 role = Role(**role_data)
                 session.add(role)
-                session.flush()
                 role_objects[role_data["name"]] = role
-                print(f"   ✅ Created role: {role_data['name']}")
-            else:
-                role_objects[role_data["name"]] = existing_role
-                print(f"   ℹ️ Role already exists: {role_data['name']}")
+                log_lines.append(f"   ✅ Created role: {role_data['name']}")
         
-        session.commit()
+        print("\n".join(log_lines))
+        
+        # New roles need their ids for the role links below
+        session.flush()
         
         # 2. Create 3 test users
         print("\n2. 👥 Creating Test Users...")
+        log_lines = []
         
-        users_data = [
-            {
-                "phone": "1111111111",
-                "name": "Admin User",
-                "email": "admin@example.com",
-                "gender": "other",
-                "date_of_birth": date(1990, 1, 15),
-                "place": "Hyderabad, Telangana",
-                "password": "admin123",
-                "role": RoleEnum.admin
-            },
-            {
-                "phone": "2222222222", 
-                "name": "Reviewer User",
-                "email": "reviewer@example.com",
-                "gender": "female",
-                "date_of_birth": date(1985, 6, 20),
-                "place": "Bangalore, Karnataka",
-                "password": "reviewer123",
-                "role": RoleEnum.reviewer
-            },
-            {
-                "phone": "3333333333",
-                "name": "Regular User",
-                "email": "user@example.com", 
-                "gender": "male",
-                "date_of_birth": date(1995, 12, 10),
-                "place": "Chennai, Tamil Nadu",
-                "password": "user123",
-                "role": RoleEnum.user
-            }
-        ]
+        # Look up all test users in one query and insert the missing ones
+        # in one statement, returning their generated ids
+        user_ids = dict(session.exec(
+            select(User.phone, User.id).where(User.phone.in_([d["phone"] for d in users_data]))
+        ).all())
         
-        created_users = []
+        # One timestamp for the whole batch; naive UTC, matching the model's
+        # datetime.utcnow defaults for the naive created_at/updated_at columns
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        new_users = []
         for user_data in users_data:
-            # Check if user already exists
-            existing_user = session.exec(
-                select(User).where(User.phone == user_data["phone"])
-            ).first()
-            
-            if existing_user:
-                print(f"   ℹ️ User already exists: {user_data['name']} ({user_data['phone']})")
-                created_users.append(existing_user)
+            if user_data["phone"] in user_ids:
+                log_lines.append(f"   ℹ️ User already exists: {user_data['name']} ({user_data['phone']})")
                 continue
             
-            # Create new user
-            user_role = user_data.pop("role")
-            password = user_data.pop("password")
-            
-            user = User(
-                **user_data,
-                hashed_password=get_password_hash(password),
-                is_active=True,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
-            )
-            
-            session.add(user)
-            session.flush()  # Get the user ID
+            user_fields = {k: v for k, v in user_data.items() if k not in ("role", "password")}
+            new_users.append({
+                **user_fields,
+                "hashed_password": password_hashes[user_data["phone"]],
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now
+            })
+        
+        if new_users:
+            inserted = session.execute(
+                insert(User).returning(User.phone, User.id), new_users,
+                execution_options=BULK_INSERT_OPTIONS
+            ).all()
+            user_ids.update(inserted)
             
-            # Assign role to user
-            role_obj = role_objects[user_role]
-            user_role_link = UserRoleLink(user_id=user.id, role_id=role_obj.id)
-            session.add(user_role_link)
+            # Assign roles to the new users in one statement
+            roles_by_phone = {d["phone"]: d["role"] for d in users_data}
+            session.execute(insert(UserRoleLink), [
+                {"user_id": user_id, "role_id": role_objects[roles_by_phone[phone]].id}
+                for phone, user_id in inserted
+            ], execution_options=BULK_INSERT_OPTIONS)
             
-            created_users.append(user)
-            print(f"   ✅ Created user: {user.name} ({user.phone}) with role: {user_role}")
+            inserted_phones = {phone for phone, _ in inserted}
+            for user_data in users_data:
+                if user_data["phone"] in inserted_phones:
+                    log_lines.append(f"   ✅ Created user: {user_data['name']} ({user_data['phone']}) with role: {user_data['role']}")
         
-        session.commit()
+        print("\n".join(log_lines))
+        
+        # Seed users' ids by role, for the records below
+        user_ids_by_role = {d["role"]: user_ids[d["phone"]] for d in users_data}
         
         # 3. Create 2 categories
         print("\n3. 📂 Creating Test Categories...")
+        log_lines = []
         
         categories_data = [
             {
@@ -148,35 +260,38 @@ def create_test_data():
             }
         ]
         
-        created_categories = []
+        category_ids = dict(session.exec(
+            select(Category.name, Category.id).where(Category.name.in_([d["name"] for d in categories_data]))
+        ).all())
+        
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        new_categories = []
         for category_data in categories_data:
-            # Check if category already exists
-            existing_category = session.exec(
-                select(Category).where(Category.name == category_data["name"])
-            ).first()
-            
-            if existing_category:
-                print(f"   ℹ️ Category already exists: {category_data['title']}")
-                created_categories.append(existing_category)
+            if category_data["name"] in category_ids:
+                log_lines.append(f"   ℹ️ Category already exists: {category_data['title']}")
                 continue
             
-            category = Category(
+            new_categories.append({
                 **category_data,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
-            )
-            
-            session.add(category)
-            session.flush()
-            created_categories.append(category)
-            print(f"   ✅ Created category: {category.title} ({category.name})")
+                "created_at": now,
+                "updated_at": now
+            })
         
-        session.commit()
+        if new_categories:
+            category_ids.update(session.execute(
+                insert(Category).returning(Category.name, Category.id), new_categories,
+                execution_options=BULK_INSERT_OPTIONS
+            ).all())
+            for category_data in new_categories:
+                log_lines.append(f"   ✅ Created category: {category_data['title']} ({category_data['name']})")
+        
+        print("\n".join(log_lines))
         
         # 4. Create 4 records
         print("\n4. 📝 Creating Test Records...")
+        log_lines = []
         
-        if len(created_users) >= 2 and len(created_categories) >= 2:
+        if len(user_ids_by_role) == len(users_data) and len(category_ids) >= len(categories_data):
             records_data = [
                 {
                     "title": "The Wise Farmer's Tale",
@@ -186,8 +301,8 @@ def create_test_data():
                     "file_name": "wise_farmer.txt",
                     "file_size": 2048,
                     "status": "uploaded",
-                    "user_id": created_users[0].id,  # Admin user
-                    "category_id": created_categories[0].id,  # Stories category
+                    "user_id": user_ids_by_role[RoleEnum.admin],
+                    "category_id": category_ids["stories"],
                     "reviewed": True
                 },
                 {
@@ -200,8 +315,8 @@ def create_test_data():
                     "status": "uploaded",
                     "geo_lat": 17.3850,  # Hyderabad coordinates
                     "geo_lng": 78.4867,
-                    "user_id": created_users[1].id,  # Reviewer user
-                    "category_id": created_categories[1].id,  # Songs category
+                    "user_id": user_ids_by_role[RoleEnum.reviewer],
+                    "category_id": category_ids["songs"],
                     "reviewed": True
                 },
                 {
@@ -214,8 +329,8 @@ def create_test_data():
                     "status": "uploaded",
                     "geo_lat": 13.0827,  # Chennai coordinates
                     "geo_lng": 80.2707,
-                    "user_id": created_users[2].id,  # Regular user
-                    "category_id": created_categories[1].id,  # Songs category (dance goes with music)
+                    "user_id": user_ids_by_role[RoleEnum.user],
+                    "category_id": category_ids["songs"],  # Dance goes with music
                     "reviewed": False
                 },
                 {
@@ -226,60 +341,62 @@ def create_test_data():
                     "file_name": "banjara_legend.txt",
                     "file_size": 3584,
                     "status": "pending",
-                    "user_id": created_users[1].id,  # Reviewer user
-                    "category_id": created_categories[0].id,  # Stories category
+                    "user_id": user_ids_by_role[RoleEnum.reviewer],
+                    "category_id": category_ids["stories"],
                     "reviewed": False
                 }
             ]
             
-            created_records = []
+            existing_titles = set(session.exec(
+                select(Record.title).where(Record.title.in_([d["title"] for d in records_data]))
+            ).all())
+            
+            now = datetime.now(timezone.utc)
+            new_records = []
             for record_data in records_data:
-                # Check if record with same title already exists
-                existing_record = session.exec(
-                    select(Record).where(Record.title == record_data["title"])
-                ).first()
-                
-                if existing_record:
-                    print(f"   ℹ️ Record already exists: {record_data['title']}")
+                if record_data["title"] in existing_titles:
+                    log_lines.append(f"   ℹ️ Record already exists: {record_data['title']}")
                     continue
                 
-                record = Record(
+                # Every row binds both coordinates; NULLs give a NULL location
+                new_records.append({
+                    "geo_lat": None,
+                    "geo_lng": None,
                     **record_data,
-                    created_at=datetime.now(timezone.utc),
-                    updated_at=datetime.now(timezone.utc)
-                )
-                
-                session.add(record)
-                created_records.append(record)
-                print(f"   ✅ Created record: {record.title} ({record.media_type})")
+                    "created_at": now,
+                    "updated_at": now
+                })
             
-            session.commit()
+            if new_records:
+                # Build each location point from the bound coordinates in
+                # PostGIS rather than formatting and parsing WKT per row
+                record_insert = insert(Record.__table__).values(
+                    location=func.ST_SetSRID(func.ST_MakePoint(bindparam("geo_lng", type_=Float), bindparam("geo_lat", type_=Float)), 4326)
+                )
+                session.execute(record_insert, new_records, execution_options=BULK_INSERT_OPTIONS)
+                for record_data in new_records:
+                    log_lines.append(f"   ✅ Created record: {record_data['title']} ({record_data['media_type']})")
             
+            seeded_titles = [d["title"] for d in records_data]
         else:
-            print("   ❌ Cannot create records: insufficient users or categories")
+            log_lines.append("   ❌ Cannot create records: insufficient users or categories")
+            seeded_titles = None
         
-        # 5. Summary
-        print("\n" + "=" * 50)
-        print("📊 Test Data Creation Summary")
-        print("=" * 50)
+        print("\n".join(log_lines))
         
-        # Count existing data
-        total_users = len(session.exec(select(User)).all())
-        total_roles = len(session.exec(select(Role)).all())
-        total_categories = len(session.exec(select(Category)).all())
-        total_records = len(session.exec(select(Record)).all())
-        total_role_assignments = len(session.exec(select(UserRoleLink)).all())
+        session.commit()
         
-        print(f"👥 Total Users: {total_users}")
-        print(f"🔑 Total Roles: {total_roles}")
-        print(f"📂 Total Categories: {total_categories}")
-        print(f"📝 Total Records: {total_records}")
-        print(f"🔗 Total Role Assignments: {total_role_assignments}")
+        # Let the next run skip seeding while this data is still in place
+        if seeded_titles is not None:
+            SEED_CACHE.write_text(json.dumps({
+                "version": _seed_version(),
+                "user_ids": {phone: str(user_id) for phone, user_id in user_ids.items()},
+                "category_ids": {name: str(category_id) for name, category_id in category_ids.items()},
+                "record_titles": seeded_titles
+            }, indent=2))
         
-        print("\n🔐 Test Login Credentials:")
-        print("   Admin:    phone=1111111111, password=admin123")
-        print("   Reviewer: phone=2222222222, password=reviewer123")
-        print("   User:     phone=3333333333, password=user123")
+        # 5. Summary
+        _print_summary(session)
         
         print("\n✅ Test data creation completed successfully!")
 
@@ -289,6 +406,8 @@ def cleanup_test_data():
     print("🧹 Cleaning up test data...")
     
     with Session(engine) as session:
+        # One bulk DELETE per table, all committed in a single transaction
+        
         # Delete test records
         test_titles = [
             "The Wise Farmer's Tale",
@@ -297,36 +416,34 @@ def cleanup_test_data():
             "The Legend of Banjara Hills"
         ]
         
-        for title in test_titles:
-            record = session.exec(select(Record).where(Record.title == title)).first()
-            if record:
-                session.delete(record)
-                print(f"   🗑️ Deleted record: {title}")
+        deleted = session.execute(
+            delete(Record).where(Record.title.in_(test_titles)).returning(Record.title)
+        ).scalars().all()
+        for title in deleted:
+            print(f"   🗑️ Deleted record: {title}")
         
         # Delete test categories
         test_category_names = ["stories", "songs"]
-        for name in test_category_names:
-            category = session.exec(select(Category).where(Category.name == name)).first()
-            if category:
-                session.delete(category)
-                print(f"   🗑️ Deleted category: {name}")
+        deleted = session.execute(
+            delete(Category).where(Category.name.in_(test_category_names)).returning(Category.name)
+        ).scalars().all()
+        for name in deleted:
+            print(f"   🗑️ Deleted category: {name}")
         
         # Delete test users and their role assignments
         test_phones = ["1111111111", "2222222222", "3333333333"]
-        for phone in test_phones:
-            user = session.exec(select(User).where(User.phone == phone)).first()
-            if user:
-                # Delete role assignments first
-                role_links = session.exec(
-                    select(UserRoleLink).where(UserRoleLink.user_id == user.id)
-                ).all()
-                for link in role_links:
-                    session.delete(link)
-                
-                session.delete(user)
-                print(f"   🗑️ Deleted user: {phone}")
+        test_user_ids = select(User.id).where(User.phone.in_(test_phones))
+        
+        # Delete role assignments first
+        session.execute(delete(UserRoleLink).where(UserRoleLink.user_id.in_(test_user_ids)))
+        deleted = session.execute(
+            delete(User).where(User.phone.in_(test_phones)).returning(User.phone)
+        ).scalars().all()
+        for phone in deleted:
+            print(f"   🗑️ Deleted user: {phone}")
         
         session.commit()
+        SEED_CACHE.unlink(missing_ok=True)
         print("✅ Cleanup completed!")
 
 
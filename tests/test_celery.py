@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Pytest suite for Celery integration in corpus-te project.
+Tests task registration, queue and schedule configuration, and the
+Redis, database and storage integrations the tasks rely on.
+"""
+
+import logging
+import pytest
+
+from tests.celery_expected import DATABASE_PROBE_SQL, EXPECTED_TASKS
+
+logger = logging.getLogger(__name__)
+
+def test_redis_connection(redis_client):
+    """Test Redis connection."""
+    assert redis_client.ping(), "Redis ping failed"
+
+def test_task_registration(registered_custom_tasks):
+    """Test that all Celery tasks are properly registered."""
+    logger.debug("Expected %d tasks, found %d tasks", len(EXPECTED_TASKS), len(registered_custom_tasks))
+    
+    assert EXPECTED_TASKS.issubset(registered_custom_tasks), \
+        f"Missing tasks: {EXPECTED_TASKS - registered_custom_tasks}"
+    assert len(EXPECTED_TASKS) == 18
+
+TASK_NAMES = (
+    'process_audio_file', 'upload_to_storage', 'batch_process_files',
+    'send_email', 'send_processing_complete_notification', 'send_bulk_notification', 'send_system_alert',
+    'analyze_audio_content', 'generate_corpus_statistics', 'batch_language_detection',
+    'cleanup_old_files', 'optimize_database', 'health_check', 'backup_database',
+    'generate_daily_report', 'generate_user_report', 'generate_system_health_report', 'export_user_data',
+)
+
+def test_task_imports(task_module):
+    """Test that all task functions can be imported without errors."""
+    # Verify all functions are exported and callable
+    for name in TASK_NAMES:
+        task = getattr(task_module, name, None)
+        assert callable(task), f"Task {name} is not callable"
+
+def test_task_sync_execution(task_module):
+    """Test synchronous execution of simple tasks (without Redis/workers)."""
+    health_check = task_module.health_check
+    
+    # Test health check task (should work without external dependencies)
+    # For bound tasks, call the underlying function directly
+    result = health_check()
+    
+    assert isinstance(result, dict), f"Expected dict result, got {type(result)}"
+    assert 'status' in result, f"Missing 'status' key in result: {result}"
+    assert 'health_status' in result, f"Missing 'health_status' key in result: {result}"
+    
+    health_status = result.get('health_status', {})
+    overall_status = health_status.get('overall', 'unknown')
+    
+    logger.debug("Health check completed: status=%s, overall=%s", result['status'], overall_status)
+
+def test_database_integration(db_session):
+    """Test database connectivity for tasks."""
+    from sqlmodel import text
+    
+    # Connectivity plus user and record table estimates in one catalog lookup
+    rows = db_session.execute(text(DATABASE_PROBE_SQL)).all()
+    assert len(rows) == 2, f"Expected user and record tables, found: {rows}"
+    
+    # Test model imports
+    from app.models import User, Record, Category
+    
+    row_estimates = dict(rows)
+    logger.debug("Database stats - Users: ~%s, Records: ~%s", row_estimates['user'], row_estimates['record'])
+
+def test_storage_integration(storage_client_class):
+    """Test Hetzner storage integration."""
+    # Just test initialization - don't perform actual operations
+    storage_client = storage_client_class()
+    
+    # Test if required methods exist
+    methods = ['upload_file_data', 'delete_object', 'list_objects']
+    for method in methods:
+        assert hasattr(storage_client, method), f"Storage method '{method}' is missing"
+
+@pytest.mark.parametrize("queue", ['default', 'file_processing', 'notifications', 'data_analysis'])
+def test_task_queue_configured(celery_app, queue):
+    """Test that each expected queue is configured."""
+    queue_names = {q.name for q in celery_app.conf.task_queues}
+    assert queue in queue_names, f"Queue '{queue}' is missing from {sorted(queue_names)}"
+
+@pytest.mark.parametrize("entry", ['cleanup-old-files', 'generate-daily-reports'])
+def test_beat_schedule_entry(celery_app, entry):
+    """Test that each expected periodic task is scheduled with a registered task."""
+    schedule = celery_app.conf.beat_schedule
+    assert entry in schedule, f"Scheduled task '{entry}' is missing"
+    assert schedule[entry]['task'] in EXPECTED_TASKS, f"Unknown task for '{entry}': {schedule[entry]['task']}"
+
+def test_celery_configuration(celery_app):
+    """Test Celery configuration."""
+    from app.core.config import settings
+    
+    # Test basic configuration
+    assert celery_app.main, "Celery app name not configured"
+    logger.debug("Celery app name: %s", celery_app.main)
+    
+    # Test configuration availability (settings may be empty in test mode)
+    broker_configured = bool(settings.CELERY_BROKER_URL)
+    result_backend_configured = bool(settings.CELERY_RESULT_BACKEND)
+    
+    logger.debug("Broker URL configured: %s", broker_configured)
+    logger.debug("Result backend configured: %s", result_backend_configured)
+    
+    # Test task routing (optional)
+    logger.debug("Task routing configured: %s", hasattr(celery_app.conf, 'task_routes'))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,12 +4,31 @@ Test script for OTP Authentication API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
-from time import sleep
 
 # API base URL
 BASE_URL = "http://localhost:8000/api/v1/auth"
 
+# Retry rate-limited or unavailable GETs with exponential backoff (0.5s, 1s, 2s).
+# The OTP POSTs are not idempotent (a retried send-otp can send another SMS)
+# and the resend step expects the server's 429, so they are never retried;
+# a final 429/503 comes back as a normal response rather than a RetryError
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 503],
+    allowed_methods=["GET"],
+    raise_on_status=False
+)
+
+# One keep-alive session for every request, so calls reuse a pooled
+# connection instead of reconnecting each time
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=RETRY))
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=RETRY))
+
 def test_send_otp():
     """Test sending OTP"""
     print("🔄 Testing OTP Send...")
@@ -19,7 +38,7 @@ def test_send_otp():
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/send-otp", json=data)
+        response = SESSION.post(f"{BASE_URL}/send-otp", json=data)
         
         if response.status_code == 200:
             result = response.json()
@@ -47,7 +66,7 @@ def test_verify_otp(otp_code):
     }
     
     try:
-        response = requests.post(f"{BASE_URL}/verify-otp", json=data)
+        response = SESSION.post(f"{BASE_URL}/verify-otp", json=data)
         
         if response.status_code == 200:
             result = response.json()
@@ -74,7 +93,7 @@ def test_resend_otp():
     }
 
     try:
-        response = requests.post(f"{BASE_URL}/resend-otp", json=data)
+        response = SESSION.post(f"{BASE_URL}/resend-otp", json=data)
         
         if response.status_code == 200:
             result = response.json()
@@ -101,7 +120,7 @@ def test_authenticated_endpoint(access_token):
     }
     
     try:
-        response = requests.get(f"{BASE_URL}/me", headers=headers)
+        response = SESSION.get(f"{BASE_URL}/me", headers=headers)
         
         if response.status_code == 200:
             result = response.json()
@@ -149,8 +168,6 @@ def main():
         print("\n❌ Authenticated endpoint test failed.")
     
     # Test 4: Resend OTP (should be rate limited)
-    print("\n⏰ Waiting a moment before testing resend...")
-    sleep(2)
     test_resend_otp()
     
     print("\n🎉 OTP Authentication API test completed!")
@@ -1,13 +1,36 @@
 """
 Test script for updated Records API endpoints with UID-based file generation
 """
-import requests
+import atexit
+import functools
 import json
+import requests
+from requests.adapters import HTTPAdapter
 import tempfile
 import os
 
+from concurrent_output import run_concurrently
+
+try:
+    from requests_toolbelt import MultipartEncoder
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
+
 API_BASE = "http://localhost:8000/api/v1"
 
+# One keep-alive session for every request, so calls reuse a pooled
+# connection instead of reconnecting each time
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# One small text file shared by the upload tests, removed when the process exits
+with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as _upload_file:
+    _upload_file.write("This is a test file for upload testing.\nGenerated automatically for API testing.")
+UPLOAD_FILE_PATH = _upload_file.name
+atexit.register(os.unlink, UPLOAD_FILE_PATH)
+
 # Test user credentials for authentication
 TEST_USER = {
     "phone": "9999999999",
@@ -16,10 +39,11 @@ TEST_USER = {
     "email": "test@example.com"
 }
 
+@functools.lru_cache(maxsize=1)
 def get_auth_token():
-    """Get authentication token for API requests"""
+    """Get authentication token for API requests, logging in once per run"""
     # Try to login first
-    login_response = requests.post(f"{API_BASE}/auth/login", json={
+    login_response = SESSION.post(f"{API_BASE}/auth/login", json={
         "phone": TEST_USER["phone"],
         "password": TEST_USER["password"]
     })
@@ -28,7 +52,7 @@ def get_auth_token():
         return login_response.json()["access_token"]
     
     # If login fails, try to register the user first
-    register_response = requests.post(f"{API_BASE}/users/", json={
+    register_response = SESSION.post(f"{API_BASE}/users/", json={
         "phone": TEST_USER["phone"],
         "password": TEST_USER["password"],
         "name": TEST_USER["name"],
@@ -38,7 +62,7 @@ def get_auth_token():
     
     if register_response.status_code in [200, 201]:
         # Now try to login
-        login_response = requests.post(f"{API_BASE}/auth/login", json={
+        login_response = SESSION.post(f"{API_BASE}/auth/login", json={
             "phone": TEST_USER["phone"],
             "password": TEST_USER["password"]
         })
@@ -48,6 +72,18 @@ def get_auth_token():
     
     return None
 
+def post_json(url, payload, headers, **kwargs):
+    """POST a JSON body, serialized once into bytes"""
+    body = json.dumps(payload).encode()
+    return SESSION.post(url, data=body, headers={**headers, "Content-Type": "application/json"}, **kwargs)
+
+def post_multipart(url, data, files, headers):
+    """POST multipart form data, streaming the files when requests_toolbelt is installed"""
+    if not TOOLBELT_AVAILABLE:
+        return SESSION.post(url, files=files, data=data, headers=headers)
+    encoder = MultipartEncoder(fields={**data, **files})
+    return SESSION.post(url, data=encoder, headers={**headers, "Content-Type": encoder.content_type})
+
 def get_auth_headers():
     """Get authentication headers for API requests"""
     token = get_auth_token()
@@ -66,59 +102,48 @@ def test_upload_endpoint_with_uid_filename():
         print("❌ Could not authenticate - skipping test")
         return None
     
-    # Create a temporary test file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as temp_file:
-        temp_file.write("This is a test file for UID-based upload testing.\nGenerated automatically for API testing.")
-        temp_file_path = temp_file.name
-    
-    try:
-        # Use actual UUIDs from the database
-        record_data = {
-            "title": "Test Upload with UID Filename",
-            "description": "Testing the new UID-based filename feature",
-            "media_type": "text",
-            "category_id": "c36fee46-3ee5-40f7-bf7d-90cf3d459808",  # stories category
-            "user_id": "5cb9390e-f30d-420e-ad04-27c65afd25f3",     # test user
-            "location": "POINT(78.4867 17.3850)"  # Hyderabad coordinates
+    # Use actual UUIDs from the database
+    record_data = {
+        "title": "Test Upload with UID Filename",
+        "description": "Testing the new UID-based filename feature",
+        "media_type": "text",
+        "category_id": "c36fee46-3ee5-40f7-bf7d-90cf3d459808",  # stories category
+        "user_id": "5cb9390e-f30d-420e-ad04-27c65afd25f3",     # test user
+        "location": "POINT(78.4867 17.3850)"  # Hyderabad coordinates
+    }
+    
+    # Prepare the multipart form data
+    with open(UPLOAD_FILE_PATH, 'rb') as f:
+        files = {
+            'file': ('test_file.txt', f, 'text/plain')
         }
         
-        # Prepare the multipart form data
-        with open(temp_file_path, 'rb') as f:
-            files = {
-                'file': ('test_file.txt', f, 'text/plain')
-            }
-            
-            data = {
-                **record_data,
-                'use_uid_filename': 'true'  # Enable UID-based filename
-            }
-            
-            response = requests.post(f"{API_BASE}/records/upload", files=files, data=data, headers=headers)
+        data = {
+            **record_data,
+            'use_uid_filename': 'true'  # Enable UID-based filename
+        }
         
-        print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        response = post_multipart(f"{API_BASE}/records/upload", data, files, headers)
+    
+    print(f"Status Code: {response.status_code}")
+    
+    if response.status_code == 201:  # Fixed: 201 is success for upload
+        record = response.json()
+        print("✅ Upload successful!")
+        print(f"Record UID: {record['uid']}")
+        print(f"File URL: {record['file_url']}")
+        print(f"Status: {record['status']}")
         
-        if response.status_code == 201:  # Fixed: 201 is success for upload
-            record = response.json()
-            print("✅ Upload successful!")
-            print(f"Record UID: {record['uid']}")
-            print(f"File URL: {record['file_url']}")
-            print(f"Status: {record['status']}")
-            
-            # Verify the filename matches the UID pattern
-            if record['file_url'] and record['uid'] in record['file_url']:
-                print("✅ Filename correctly uses record UID!")
-            else:
-                print("❌ Filename doesn't match UID pattern")
-                
-            return record
+        # Verify the filename matches the UID pattern
+        if record['file_url'] and record['uid'] in record['file_url']:
+            print("✅ Filename correctly uses record UID!")
         else:
-            print(f"❌ Upload failed: {response.text}")
-            return None
+            print("❌ Filename doesn't match UID pattern")
             
-    finally:
-        # Clean up temp file
-        os.unlink(temp_file_path)
+        return record
+    else:
+        print(f"❌ Upload failed: {response.text}")
+        return None
 
 def test_create_endpoint_with_file_generation():
     """Test the / endpoint (POST) with generate_file=True"""
@@ -150,10 +175,9 @@ def test_create_endpoint_with_file_generation():
         "file_size_kb": "20"
     }
     
-    response = requests.post(f"{API_BASE}/records/", json=record_data, params=params, headers=headers)
+    response = post_json(f"{API_BASE}/records/", record_data, headers, params=params)
     
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
     
     if response.status_code == 201:
         record = response.json()
@@ -185,54 +209,43 @@ def test_regular_upload_endpoint():
         print("❌ Could not authenticate - skipping test")
         return None
     
-    # Create a temporary test file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as temp_file:
-        temp_file.write("This is a test file for regular upload testing.\nTesting backward compatibility.")
-        temp_file_path = temp_file.name
-    
-    try:
-        # Test data for the record - use actual UUIDs
-        record_data = {
-            "title": "Test Regular Upload",
-            "description": "Testing backward compatibility",
-            "media_type": "text",
-            "category_id": "c36fee46-3ee5-40f7-bf7d-90cf3d459808",  # stories category
-            "user_id": "5cb9390e-f30d-420e-ad04-27c65afd25f3",     # test user
-            "location": "POINT(80.2707 13.0827)"  # Chennai coordinates
+    # Test data for the record - use actual UUIDs
+    record_data = {
+        "title": "Test Regular Upload",
+        "description": "Testing backward compatibility",
+        "media_type": "text",
+        "category_id": "c36fee46-3ee5-40f7-bf7d-90cf3d459808",  # stories category
+        "user_id": "5cb9390e-f30d-420e-ad04-27c65afd25f3",     # test user
+        "location": "POINT(80.2707 13.0827)"  # Chennai coordinates
+    }
+    
+    # Prepare the multipart form data (use_uid_filename defaults to False)
+    with open(UPLOAD_FILE_PATH, 'rb') as f:
+        files = {
+            'file': ('regular_test_file.txt', f, 'text/plain')
         }
         
-        # Prepare the multipart form data (use_uid_filename defaults to False)
-        with open(temp_file_path, 'rb') as f:
-            files = {
-                'file': ('regular_test_file.txt', f, 'text/plain')
-            }
-            
-            response = requests.post(f"{API_BASE}/records/upload", files=files, data=record_data, headers=headers)
-        
-        print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        response = post_multipart(f"{API_BASE}/records/upload", record_data, files, headers)
+    
+    print(f"Status Code: {response.status_code}")
+    
+    if response.status_code == 201:  # Fixed: 201 is success for upload
+        record = response.json()
+        print("✅ Regular upload successful!")
+        print(f"Record UID: {record['uid']}")
+        print(f"File URL: {record['file_url']}")
+        print(f"Status: {record['status']}")
         
-        if response.status_code == 201:  # Fixed: 201 is success for upload
-            record = response.json()
-            print("✅ Regular upload successful!")
-            print(f"Record UID: {record['uid']}")
-            print(f"File URL: {record['file_url']}")
-            print(f"Status: {record['status']}")
-            
-            # Verify the filename uses original name (not UID)
-            if record['file_url'] and 'regular_test_file' in record['file_url']:
-                print("✅ Filename correctly uses original file name!")
-            else:
-                print("⚠️  Filename pattern might have changed")
-                
-            return record
+        # Verify the filename uses original name (not UID)
+        if record['file_url'] and 'regular_test_file' in record['file_url']:
+            print("✅ Filename correctly uses original file name!")
         else:
-            print(f"❌ Regular upload failed: {response.text}")
-            return None
+            print("⚠️  Filename pattern might have changed")
             
-    finally:
-        # Clean up temp file
-        os.unlink(temp_file_path)
+        return record
+    else:
+        print(f"❌ Regular upload failed: {response.text}")
+        return None
 
 def test_regular_create_endpoint():
     """Test the / endpoint (POST) without file generation (backward compatibility)"""
@@ -258,10 +271,9 @@ def test_regular_create_endpoint():
         }  # Mumbai coordinates as object
     }
     
-    response = requests.post(f"{API_BASE}/records/", json=record_data, headers=headers)
+    response = post_json(f"{API_BASE}/records/", record_data, headers)
     
     print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
     
     if response.status_code == 201:
         record = response.json()
@@ -285,31 +297,34 @@ def main():
     """Run all tests"""
     print("🚀 Starting API endpoint tests...")
     
-    # Test new features
-    uploaded_record = test_upload_endpoint_with_uid_filename()
-    generated_record = test_create_endpoint_with_file_generation()
+    # Log in once up front so the concurrent tests share the cached token
+    get_auth_token()
     
-    # Test backward compatibility
-    regular_upload_record = test_regular_upload_endpoint()
-    regular_create_record = test_regular_create_endpoint()
+    tests = [
+        # Test new features
+        ("Upload with UID filename", test_upload_endpoint_with_uid_filename),
+        ("Create with file generation", test_create_endpoint_with_file_generation),
+        # Test backward compatibility
+        ("Regular upload (backward compatibility)", test_regular_upload_endpoint),
+        ("Regular create (backward compatibility)", test_regular_create_endpoint)
+    ]
+    
+    # The tests create independent records, so run them concurrently and
+    # replay each one's captured output in the original order
+    records = run_concurrently([test for _, test in tests])
     
     # Summary
     print("\n" + "=" * 60)
     print("TEST SUMMARY")
     print("=" * 60)
     
-    tests = [
-        ("Upload with UID filename", uploaded_record is not None),
-        ("Create with file generation", generated_record is not None),
-        ("Regular upload (backward compatibility)", regular_upload_record is not None),
-        ("Regular create (backward compatibility)", regular_create_record is not None)
-    ]
+    results = [(test_name, record is not None) for (test_name, _), record in zip(tests, records)]
     
-    for test_name, passed in tests:
+    for test_name, passed in results:
         status = "✅ PASSED" if passed else "❌ FAILED"
         print(f"{test_name}: {status}")
     
-    all_passed = all(passed for _, passed in tests)
+    all_passed = all(passed for _, passed in results)
     print(f"\nOverall: {'✅ ALL TESTS PASSED' if all_passed else '❌ SOME TESTS FAILED'}")
     
     return all_passed
@@ -5,7 +5,7 @@ Verification script to check test data creation
 
 import os
 import sys
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func, select
 from sqlalchemy.orm import sessionmaker
 
 # Add the project root to Python path
@@ -25,39 +25,48 @@ def verify_test_data():
     print("=" * 50)
     
     with SessionLocal() as session:
+        # Each section counts its rows in SQL and streams the detail rows in
+        # batches, instead of loading whole tables to count and list them
+        def count(model):
+            return session.scalar(select(func.count()).select_from(model))
+        
         # Check roles
-        roles = session.query(Role).all()
-        print(f"🔑 Roles: {len(roles)}")
-        for role in roles:
-            print(f"   - {role.name}")
+        print(f"🔑 Roles: {count(Role)}")
+        for (role_name,) in session.query(Role.name).yield_per(1000):
+            print(f"   - {role_name}")
         
         # Check users
-        users = session.query(User).all()
-        print(f"\n👥 Users: {len(users)}")
-        for user in users:
-            print(f"   - {user.name} ({user.phone})")
+        print(f"\n👥 Users: {count(User)}")
+        for user_name, phone in session.query(User.name, User.phone).yield_per(1000):
+            print(f"   - {user_name} ({phone})")
         
-        # Check user-role assignments
-        user_roles = session.query(UserRoleLink).all()
-        print(f"\n🔗 User-Role Assignments: {len(user_roles)}")
-        for ur in user_roles:
-            user = session.query(User).filter(User.id == ur.user_id).first()
-            role = session.query(Role).filter(Role.id == ur.role_id).first()
-            print(f"   - {user.name} → {role.name}")
+        # Check user-role assignments, resolving both names in one joined query
+        print(f"\n🔗 User-Role Assignments: {count(UserRoleLink)}")
+        user_roles = (
+            session.query(User.name, Role.name)
+            .select_from(UserRoleLink)
+            .join(User, User.id == UserRoleLink.user_id)
+            .join(Role, Role.id == UserRoleLink.role_id)
+            .yield_per(1000)
+        )
+        for user_name, role_name in user_roles:
+            print(f"   - {user_name} → {role_name}")
         
         # Check categories
-        categories = session.query(Category).all()
-        print(f"\n📂 Categories: {len(categories)}")
-        for category in categories:
-            print(f"   - {category.name}")
+        print(f"\n📂 Categories: {count(Category)}")
+        for (category_name,) in session.query(Category.name).yield_per(1000):
+            print(f"   - {category_name}")
         
-        # Check records
-        records = session.query(Record).all()
-        print(f"\n📝 Records: {len(records)}")
-        for record in records:
-            category = session.query(Category).filter(Category.id == record.category_id).first()
-            user = session.query(User).filter(User.id == record.user_id).first()
-            print(f"   - {record.title} ({record.media_type}) | Category: {category.name} | Created by: {user.name}")
+        # Check records, with their category and creator names in the same query
+        print(f"\n📝 Records: {count(Record)}")
+        records = (
+            session.query(Record.title, Record.media_type, Category.name, User.name)
+            .outerjoin(Category, Category.id == Record.category_id)
+            .outerjoin(User, User.id == Record.user_id)
+            .yield_per(1000)
+        )
+        for title, media_type, category_name, user_name in records:
+            print(f"   - {title} ({media_type}) | Category: {category_name} | Created by: {user_name}")
     
     print("\n✅ Verification completed successfully!")
 